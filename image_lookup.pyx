@@ -0,0 +1,34 @@
+# cython: language_level=3
+"""
+Compiled version of the image index candidate pick used by
+mf_rename_tool.ImageTool.find_image_file.
+
+Optional: mf_rename_tool falls back to an identical pure-Python pick when
+this isn't built. Build in place with:
+
+    cythonize -i image_lookup.pyx
+"""
+
+def pick(list candidates, str preferred):
+    """
+    candidates is a list of (full_path, ext_lower, size) tuples.
+    Returns (index, was_fallback): the first entry with the preferred
+    extension, otherwise the largest file.
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t best = -1
+    cdef long long best_size = -1
+    cdef long long sz
+
+    for i in range(len(candidates)):
+        entry = <tuple>candidates[i]
+
+        if entry[1] == preferred:
+            return i, False
+
+        sz = entry[2]
+        if sz > best_size:
+            best_size = sz
+            best = i
+
+    return best, True
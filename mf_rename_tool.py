@@ -1,19 +1,39 @@
 # ---------------- STANDARD LIBRARY ----------------
+import os
 import sys
-import re
 import shutil
+import time
 import logging
+import threading
+import functools
+import importlib.util
 from pathlib import Path
+from urllib.request import urlopen
 
 # ---------------- THIRD-PARTY ----------------
 import pandas as pd
-import requests
 import webbrowser
-from PIL import Image
+from PIL import Image, features
+
+# Optional compiled candidate pick (see image_lookup.pyx)
+try:
+    from image_lookup import pick as pick_candidate
+except ImportError:
+    pick_candidate = None
 
 # ---------------- QT ----------------
-from PySide6.QtCore import Qt, QSettings
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import (
+    Qt,
+    QSettings,
+    QObject,
+    QRunnable,
+    QThread,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QPixmap, QImageReader
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -33,19 +53,43 @@ from PySide6.QtWidgets import (
     QTextEdit,
     QProgressDialog,
     QProgressBar,
+    QSpinBox,
 )
 
 APP_VERSION = "1.0.0"
 
+# Pillow built against libjpeg-turbo (stock wheels, or Pillow-SIMD as a
+# drop-in replacement) encodes JPEGs several times faster than plain libjpeg.
+JPEG_TURBO = bool(features.check_feature("libjpeg_turbo"))
+
 # ---------------- UTILS ----------------
+_SENTINEL = object()
+
+# Characters Windows doesn't allow in file names
+_SANITIZE_TBL = str.maketrans('', '', '<>:"/\\|?*')
+
 def sanitize_filename(name: str) -> str:
-    return re.sub(r'[<>:"/\\|?*]', '', name).strip()
+    return name.translate(_SANITIZE_TBL).strip()
 
-def convert_image(src: Path, dst: Path):
+def convert_image(src: Path, dst: Path, max_side: int = 0):
     """
     Convert image at src to dst format using Pillow.
+    If max_side is set, images larger than that on their longest side
+    are downscaled to fit.
     """
     with Image.open(src) as img:
+        # Let the JPEG decoder skip detail we'd throw away anyway
+        if max_side and src.suffix.lower() in {".jpg", ".jpeg"}:
+            img.draft("RGB", (max_side, max_side))
+
+        if max_side and max(img.size) > max_side:
+            # Pillow resizes "P" and "1" images with NEAREST; expand them
+            # first so the LANCZOS filter actually applies
+            if img.mode in ("P", "1"):
+                img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+
+            img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+
         # Convert to RGB for formats like JPG that don't support alpha
         if dst.suffix.lower() in {".jpg", ".jpeg"}:
             if img.mode in ("RGBA", "P"):
@@ -55,24 +99,99 @@ def convert_image(src: Path, dst: Path):
         else:
             img.save(dst)
             
-def get_safe_dest_path(dest_path: Path) -> Path:
+# calamine (python-calamine) is several times faster than openpyxl on .xlsx
+_EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+
+def read_excel(path, **kwargs) -> pd.DataFrame:
+    """
+    pd.read_excel with every column read as strings, whichever columns are
+    loaded, so a sheet gives the same names and vendors however it was opened.
+    """
+    return pd.read_excel(path, engine=_EXCEL_ENGINE, dtype="string", **kwargs)
+
+def fast_copy(src: Path, dst: Path):
+    """
+    Copy src to dst with os.copy_file_range where available, so the data
+    never passes through userspace. Falls back to shutil.copyfile, and
+    copies metadata afterwards like shutil.copy2.
+    """
+    # -1 until copy_file_range has run; anything but 0 afterwards means it
+    # wasn't available, failed, or stopped short, so copy the plain way
+    remaining = -1
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                src_fd = fsrc.fileno()
+                dst_fd = fdst.fileno()
+                remaining = os.fstat(src_fd).st_size
+
+                while remaining > 0:
+                    n = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+        except OSError:
+            remaining = -1
+
+    if remaining != 0:
+        shutil.copyfile(src, dst)
+
+    shutil.copystat(src, dst)
+
+def get_safe_dest_path(dest_path: Path, taken: set = None) -> Path:
     """
     If dest_path exists, append _1, _2, etc. until a free name is found.
+    If taken is given (a set of casefolded names in the parent
+    folder), it is probed instead of the filesystem and the chosen name
+    is added to it.
     """
-    if not dest_path.exists():
-        return dest_path
+    def exists(p: Path) -> bool:
+        if taken is None:
+            return p.exists()
+        return p.name.casefold() in taken
 
     stem = dest_path.stem
     suffix = dest_path.suffix
     parent = dest_path.parent
 
+    candidate = dest_path
     i = 1
-    while True:
+    while exists(candidate):
         candidate = parent / f"{stem}_{i}{suffix}"
-        if not candidate.exists():
-            return candidate
         i += 1
 
+    if taken is not None:
+        taken.add(candidate.name.casefold())
+
+    return candidate
+
+@functools.lru_cache(maxsize=64)
+def load_scaled_pixmap(path_str: str, mtime: float, w: int, h: int) -> QPixmap:
+    """
+    Load an image scaled to fit w x h. Cached per (path, mtime, size), so
+    repeated previews of the same file skip the full-resolution decode.
+    """
+    pixmap = QPixmap(path_str)
+
+    if pixmap.isNull():
+        return pixmap
+
+    return pixmap.scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+def preview_pixmap(path: Path, w: int, h: int) -> QPixmap:
+    """
+    load_scaled_pixmap for a Path. If the file can't be stat'ed (deleted or
+    moved since indexing) it loads uncached, giving a null pixmap rather
+    than raising.
+    """
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return load_scaled_pixmap.__wrapped__(str(path), 0.0, w, h)
+
+    return load_scaled_pixmap(str(path), mtime, w, h)
+
 class ImagePreviewDialog(QDialog):
     def __init__(self, image_path: Path, dest_path: Path, parent=None):
         super().__init__(parent)
@@ -82,26 +201,30 @@ class ImagePreviewDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Image preview
-        pixmap = QPixmap(str(image_path))
+        pixmap = preview_pixmap(image_path, 450, 350)
         img_label = QLabel()
         img_label.setAlignment(Qt.AlignCenter)
 
         if not pixmap.isNull():
-            img_label.setPixmap(
-                pixmap.scaled(450, 350, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+            img_label.setPixmap(pixmap)
         else:
             img_label.setText("Unable to preview image")
 
         layout.addWidget(img_label)
 
-        # Info text
-        stat = image_path.stat()
+        # Info text (size comes from the file header, not the scaled preview)
+        size = QImageReader(str(image_path)).size()
+
+        try:
+            file_size = f"{image_path.stat().st_size / 1024:.1f} KB"
+        except OSError:
+            file_size = "unavailable"
+
         info = (
             f"Source: {image_path}\n"
             f"Destination: {dest_path.name}\n\n"
-            f"Resolution: {pixmap.width()} x {pixmap.height()}\n"
-            f"File size: {stat.st_size / 1024:.1f} KB\n"
+            f"Resolution: {size.width()} x {size.height()}\n"
+            f"File size: {file_size}\n"
             f"Type: {image_path.suffix}"
         )
 
@@ -133,9 +256,9 @@ def check_for_updates():
     url = "https://raw.githubusercontent.com/Matt-Salv/MF-Rename-Tool/main/version.txt"
     
     try:
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        latest_version = response.text.strip()
+        # urlopen raises on HTTP errors, same as raise_for_status()
+        with urlopen(url, timeout=5) as response:
+            latest_version = response.read(64).decode("utf-8", "replace").strip()
 
         if latest_version != APP_VERSION:
             return latest_version
@@ -146,7 +269,373 @@ def check_for_updates():
 
     return None
 
-# ---------------- UTILS END ----------------        
+def count_result(counts: dict, mode: str, renamed: bool):
+    if mode == "convert":
+        key = "converted_renamed" if renamed else "converted_original"
+    else:
+        key = "copied_renamed" if renamed else "copied_original"
+
+    counts[key] += 1
+
+def _pick_candidate_py(candidates: list, preferred: str):
+    """
+    candidates is a list of (full_path, ext_lower, size) tuples.
+    Returns (index, was_fallback): the first entry with the preferred
+    extension, otherwise the largest file.
+    """
+    best = -1
+    best_size = -1
+
+    for i, (_, ext, size) in enumerate(candidates):
+        if ext == preferred:
+            return i, False
+
+        if size > best_size:
+            best_size = size
+            best = i
+
+    return best, True
+
+if pick_candidate is None:
+    pick_candidate = _pick_candidate_py
+
+# ---------------- UTILS END ----------------
+
+# ---------------- WORKERS ----------------
+class CopyJobSignals(QObject):
+    finished = Signal(dict)
+
+class CopyJob(QRunnable):
+    """
+    Copy or convert a single image on a QThreadPool worker.
+    Emits a result dict when done so counters stay on the GUI thread.
+    """
+    def __init__(self, src_path: Path, dest_path: Path, mode: str, renamed: bool,
+                 max_side: int = 0):
+        super().__init__()
+        self.src_path = src_path
+        self.dest_path = dest_path
+        self.mode = mode  # "copy" | "convert"
+        self.renamed = renamed
+        self.max_side = max_side
+        self.signals = CopyJobSignals()
+
+    def run(self):
+        result = {
+            "src": self.src_path,
+            "dest": self.dest_path,
+            "mode": self.mode,
+            "renamed": self.renamed,
+            "error": None,
+        }
+
+        try:
+            if self.mode == "convert":
+                convert_image(self.src_path, self.dest_path, self.max_side)
+            else:
+                fast_copy(self.src_path, self.dest_path)
+        except Exception as e:
+            result["error"] = str(e)
+
+        self.signals.finished.emit(result)
+
+class CopyBatchJob(QRunnable):
+    """
+    Copy a batch of (src, dest) pairs on one QThreadPool worker, so large
+    runs of plain copies don't pay for a runnable and signal object per
+    file. Emits one result dict per file, same as CopyJob.
+    """
+    def __init__(self, pairs: list, renamed: bool):
+        super().__init__()
+        self.pairs = pairs
+        self.renamed = renamed
+        self.signals = CopyJobSignals()
+
+    def run(self):
+        for src_path, dest_path in self.pairs:
+            result = {
+                "src": src_path,
+                "dest": dest_path,
+                "mode": "copy",
+                "renamed": self.renamed,
+                "error": None,
+            }
+
+            try:
+                fast_copy(src_path, dest_path)
+            except Exception as e:
+                result["error"] = str(e)
+
+            self.signals.finished.emit(result)
+
+class UpdateCheckSignals(QObject):
+    result = Signal(object)  # latest version string, or None
+
+class UpdateCheckJob(QRunnable):
+    """
+    Run check_for_updates() on the thread pool so a slow network never
+    delays showing the window.
+    """
+    def __init__(self):
+        super().__init__()
+        self.signals = UpdateCheckSignals()
+
+    def run(self):
+        self.signals.result.emit(check_for_updates())
+
+class RunWorker(QObject):
+    """
+    Plans a processing run on a QThread and feeds the copy/convert jobs to
+    the thread pool. Progress goes back to the GUI through signals; rows
+    that need a ConversionDialog are handed back in the finished result.
+    """
+    progress = Signal(int)
+    status = Signal(str)
+    finished = Signal(dict)
+
+    def __init__(self, tool, rows, base: Path, img_col: str, rename_col: str,
+                 out_dir: Path, show_preview: bool):
+        super().__init__()
+        self.tool = tool
+        self.rows = rows
+        self.base = base
+        self.excel_path = tool.excel_path
+        self.img_col = img_col
+        self.rename_col = rename_col
+        self.rename_enabled = bool(rename_col and rename_col.strip())
+        self.out_dir = out_dir
+        self.show_preview = show_preview
+
+        # Snapshot settings so edits during the run don't apply half-way
+        self.preferred_ext = tool.preferred_ext
+        self.fallback_mode = tool.fallback_mode
+        self.max_side = tool.max_side
+
+        self.counts = {
+            "copied_original": 0,
+            "copied_renamed": 0,
+            "converted_original": 0,
+            "converted_renamed": 0,
+            "failed": 0,
+        }
+        self.done = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._all_done = threading.Event()
+        self._last_ui = 0.0
+
+    @Slot()
+    def run(self):
+        # Always report back, so the GUI never stays locked in "running"
+        result = {"error": "Run stopped unexpectedly."}
+
+        try:
+            result = self.process()
+        except Exception as e:
+            logging.exception("Run failed")
+            result = {"error": str(e)}
+        finally:
+            self.finished.emit(result)
+
+    def process(self) -> dict:
+        rows = self.rows
+        rename_enabled = self.rename_enabled
+        out_dir = self.out_dir
+        not_found_rows = []
+
+        # Rows are planned here; the actual copy/convert work is handed to
+        # the thread pool. Fallbacks that need a ConversionDialog are
+        # returned to the GUI thread and handled serially afterwards.
+        jobs = []
+        copy_pairs = []
+        dialog_queue = []
+
+        self.status.emit("Indexing images...")
+        self.tool.build_image_index(self.base)
+
+        for folder, error in self.tool.index_skipped:
+            logging.warning(f"Skipped unreadable folder while indexing: {folder} ({error})")
+
+        self.status.emit("Planning...")
+
+        # Work out file names and output stems for every row in one
+        # vectorized pass, so the loop below only does lookups and dispatch
+        paths = rows[self.img_col].astype("string")
+        names = paths.str.rsplit("/", n=1).str[-1].str.rsplit("\\", n=1).str[-1]
+        stems = names.str.rsplit(".", n=1).str[0].str.lower()
+
+        if rename_enabled:
+            new = rows[self.rename_col].astype("string").str.strip()
+            has_new = (new.str.len() > 0).fillna(False)
+            output_stems = new.map(sanitize_filename, na_action="ignore").where(has_new, stems)
+        else:
+            output_stems = stems
+
+        plan = pd.DataFrame({"name": names, "stem": stems, "out": output_stems})
+
+        for i, (filename, original_stem, output_stem) in enumerate(
+            plan.itertuples(index=False, name=None)
+        ):
+
+            if pd.isna(original_stem):
+                logging.warning("Row has empty image path — marked not found")
+                not_found_rows.append(i)
+                self.done += 1
+                continue
+
+            src_path, was_fallback = self.tool.find_image_file(
+                original_stem, self.preferred_ext
+            )
+
+            if src_path:
+                dest_path = self.tool.resolve_output_path(
+                    out_dir,
+                    output_stem,
+                    self.preferred_ext
+                )
+
+                if not was_fallback:
+                    logging.info(f"COPY preferred: {src_path} -> {dest_path}")
+                    copy_pairs.append((src_path, dest_path))
+
+                else:
+                    logging.info(f"Fallback found: {src_path}")
+
+                    if self.fallback_mode == "convert" and self.show_preview:
+                        dialog_queue.append((src_path, dest_path))
+
+                    elif self.fallback_mode == "convert":
+                        logging.info(f"CONVERT fallback: {src_path} -> {dest_path}")
+                        jobs.append(
+                            CopyJob(src_path, dest_path, "convert", rename_enabled, self.max_side)
+                        )
+
+                    elif self.fallback_mode == "copy":
+                        logging.info(f"COPY fallback as-is: {src_path} -> {dest_path}")
+                        copy_pairs.append((src_path, dest_path))
+
+                    else:
+                        logging.warning(f"NOT FOUND in index: {filename}")
+                        not_found_rows.append(i)
+                        self.done += 1
+
+            else:
+                logging.warning(f"NOT FOUND in index: {filename}")
+                not_found_rows.append(i)
+                self.done += 1
+
+        # ---- Parallel copy / convert ----
+        pool = QThreadPool.globalInstance()
+        pool.setMaxThreadCount(os.cpu_count() or 1)
+
+        self._pending = len(jobs) + len(copy_pairs)
+
+        # Plain copies are cheap per file, so hand them out in batches; keep
+        # enough batches to spread them over every worker thread.
+        threads = pool.maxThreadCount()
+        batch_size = max(1, min(128, len(copy_pairs) // (threads * 4)))
+
+        for start in range(0, len(copy_pairs), batch_size):
+            jobs.append(
+                CopyBatchJob(copy_pairs[start:start + batch_size], rename_enabled)
+            )
+
+        self.report(force=True)
+
+        if not self._pending:
+            self._all_done.set()
+
+        for job in jobs:
+            # Counted straight on the pool thread, under self._lock
+            job.signals.finished.connect(self.on_job_finished, Qt.DirectConnection)
+            pool.start(job)
+
+        self._all_done.wait()
+
+        missing_exported = False
+
+        if not_found_rows:
+            self.status.emit("Exporting missing rows...")
+            missing_exported = self.export_missing(not_found_rows)
+
+        return {
+            "error": None,
+            "counts": self.counts,
+            "done": self.done,
+            "not_found_rows": not_found_rows,
+            "missing_exported": missing_exported,
+            "dialog_queue": dialog_queue,
+            "rows": rows,
+            "out_dir": out_dir,
+            "rename_enabled": rename_enabled,
+            "max_side": self.max_side,
+        }
+
+    def export_missing(self, not_found_rows: list) -> bool:
+        """
+        Writes the not-found rows to not_found_images.xlsx. The working frame
+        may hold only the mapped columns, all as strings, so the rows are
+        taken from a fresh read of the original sheet instead.
+        """
+        missing_path = self.out_dir / "not_found_images.xlsx"
+        # read_excel leaves a RangeIndex, so row labels are sheet positions
+        positions = self.rows.index[not_found_rows]
+
+        try:
+            sheet = pd.read_excel(self.excel_path, engine=_EXCEL_ENGINE)
+            df_missing = sheet.iloc[positions]
+        except Exception as e:
+            logging.warning(
+                f"Could not re-read {self.excel_path} ({e}) — exporting loaded columns only"
+            )
+            df_missing = self.rows.iloc[not_found_rows]
+
+        try:
+            df_missing.to_excel(missing_path, index=False)
+        except Exception as e:
+            logging.error(f"Could not write {missing_path}: {e}")
+            return False
+
+        return True
+
+    def on_job_finished(self, result: dict):
+        """
+        Runs on the pool thread for every copy/convert that completes.
+        """
+        with self._lock:
+            self._pending -= 1
+            self.done += 1
+
+            if result["error"]:
+                logging.error(f"FAILED: {result['src']} -> {result['dest']}: {result['error']}")
+                self.counts["failed"] += 1
+            else:
+                count_result(self.counts, result["mode"], result["renamed"])
+
+            last = not self._pending
+            verb = "Converting" if result["mode"] == "convert" else "Copying"
+            self.report(f"{verb}: {result['dest'].name}", force=last)
+
+        if last:
+            self._all_done.set()
+
+    def report(self, text: str = None, force: bool = False):
+        """
+        Emit progress (and optionally a status line), at most every 32 items
+        or 100 ms unless forced.
+        """
+        now = time.monotonic()
+
+        if not force and self.done % 32 and now - self._last_ui < 0.1:
+            return
+
+        self._last_ui = now
+
+        if text:
+            self.status.emit(text)
+        self.progress.emit(self.done)
+
+# ---------------- WORKERS END ----------------        
 
 # ---------------- MAIN WINDOW ----------------
 class ImageTool(QMainWindow):
@@ -157,31 +646,55 @@ class ImageTool(QMainWindow):
         self.convert_all_mode = False
         self.settings = QSettings("Mayflower", "ImageTool")
         self.df = None
+        self.excel_path = ""
         self.columns = []
+        self.vendors_set = set()
+        self._vendor_cache = None  # (df, vendor_col, categorical Series)
         self._build_ui()
+
+        if not JPEG_TURBO:
+            self.status_label.setText(
+                "Pillow is not using libjpeg-turbo; image conversion will be slower."
+            )
+
         self.preferred_ext = ".jpg"
         self.fallback_mode = "convert"  # "none" | "copy" | "convert"
+        self.max_side = 0  # 0 = keep source resolution
         self.load_settings()
         self.convert_all_mode = False
         self.cancel_all_mode = False
+        self._out_names = set()
+        self._find_cache = {}
+        self._run_result = None
+        self.run_thread = None
+        self.run_worker = None
+        self.running = False
 
-        try:
-            latest = check_for_updates()
+        # Check for updates once the window is up, off the GUI thread
+        QTimer.singleShot(0, self.start_update_check)
 
-            if latest:
-                reply = QMessageBox.question(
-                    self,
-                    "Update Available",
-                    f"A new version ({latest}) is available.\n\n"
-                    f"You are running {APP_VERSION}.\n\n"
-                    "Would you like to download it?",
-                    QMessageBox.Yes | QMessageBox.No
-                )
+    def start_update_check(self):
+        self._update_job = UpdateCheckJob()
+        self._update_job.signals.result.connect(self.on_update_result)
+        QThreadPool.globalInstance().start(self._update_job)
+
+    def on_update_result(self, latest):
+        self._update_job = None
 
-                if reply == QMessageBox.Yes:
-                    webbrowser.open("https://raw.githubusercontent.com/Matt-Salv/MF-Rename-Tool/main/version.txt")
-        except Exception:
-            pass
+        if not latest:
+            return
+
+        reply = QMessageBox.question(
+            self,
+            "Update Available",
+            f"A new version ({latest}) is available.\n\n"
+            f"You are running {APP_VERSION}.\n\n"
+            "Would you like to download it?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+
+        if reply == QMessageBox.Yes:
+            webbrowser.open("https://raw.githubusercontent.com/Matt-Salv/MF-Rename-Tool/main/version.txt")
 
   
     # ---------------- UI ----------------
@@ -201,32 +714,32 @@ class ImageTool(QMainWindow):
 
         # Excel
         self.excel_edit = QLineEdit()
-        excel_btn = QPushButton("Browse")
-        excel_btn.clicked.connect(self.select_excel)
+        self.excel_btn = QPushButton("Browse")
+        self.excel_btn.clicked.connect(self.select_excel)
 
         excel_row = QHBoxLayout()
         excel_row.addWidget(self.excel_edit)
-        excel_row.addWidget(excel_btn)
+        excel_row.addWidget(self.excel_btn)
         form.addRow("Excel Spreadsheet", excel_row)
 
         # Base Image Folder
         self.base_edit = QLineEdit()
-        base_btn = QPushButton("Browse")
-        base_btn.clicked.connect(self.select_base)
+        self.base_btn = QPushButton("Browse")
+        self.base_btn.clicked.connect(self.select_base)
 
         base_row = QHBoxLayout()
         base_row.addWidget(self.base_edit)
-        base_row.addWidget(base_btn)
+        base_row.addWidget(self.base_btn)
         form.addRow("Base Image Folder (Optional)", base_row)
 
         # Output Folder
         self.out_edit = QLineEdit()
-        out_btn = QPushButton("Browse")
-        out_btn.clicked.connect(self.select_output)
+        self.out_btn = QPushButton("Browse")
+        self.out_btn.clicked.connect(self.select_output)
 
         out_row = QHBoxLayout()
         out_row.addWidget(self.out_edit)
-        out_row.addWidget(out_btn)
+        out_row.addWidget(self.out_btn)
         form.addRow("Output Folder", out_row)
 
         main_layout.addLayout(form)
@@ -254,13 +767,13 @@ class ImageTool(QMainWindow):
         main_layout.addLayout(map_form)
         main_layout.addStretch()
 
-        run_btn = QPushButton("Run")
-        run_btn.setFixedWidth(120)
-        run_btn.clicked.connect(self.run)
+        self.run_btn = QPushButton("Run")
+        self.run_btn.setFixedWidth(120)
+        self.run_btn.clicked.connect(self.run)
 
         btn_row = QHBoxLayout()
         btn_row.addStretch()
-        btn_row.addWidget(run_btn)
+        btn_row.addWidget(self.run_btn)
         main_layout.addLayout(btn_row)
 
         self.status_label = QLabel("")
@@ -279,10 +792,10 @@ class ImageTool(QMainWindow):
         main_layout.addWidget(self.progress_bar)
 
         # -------- SETTINGS TAB --------
-        settings_tab = QWidget()
-        tabs.addTab(settings_tab, "Settings")
+        self.settings_tab = QWidget()
+        tabs.addTab(self.settings_tab, "Settings")
 
-        settings_layout = QFormLayout(settings_tab)
+        settings_layout = QFormLayout(self.settings_tab)
         settings_layout.setSpacing(12)
         self.remember_checkbox = QCheckBox("Remember previous inputs")
         settings_layout.addWidget(self.remember_checkbox)
@@ -310,6 +823,18 @@ class ImageTool(QMainWindow):
         self.fallback_box.currentTextChanged.connect(self.update_fallback_mode)
         settings_layout.addRow("When Preferred Type Not Found", self.fallback_box)
 
+        # Downscale converted images
+        self.max_side_box = QSpinBox()
+        self.max_side_box.setRange(0, 20000)
+        self.max_side_box.setSingleStep(100)
+        self.max_side_box.setSuffix(" px")
+        self.max_side_box.setSpecialValueText("Source resolution")
+        self.max_side_box.valueChanged.connect(
+            lambda v: setattr(self, "max_side", v)
+        )
+
+        settings_layout.addRow("Max Converted Image Size", self.max_side_box)
+
         # Overwrite / duplicate handling
         self.preview_toggle = QComboBox()
         self.preview_toggle.addItems([
@@ -335,6 +860,17 @@ class ImageTool(QMainWindow):
         )
 
         settings_layout.addRow("Duplicate Filename Handling", self.rename_toggle)
+
+        # Everything a run reads from; locked while one is in progress
+        self.run_locked_widgets = [
+            self.excel_edit, self.excel_btn,
+            self.base_edit, self.base_btn,
+            self.out_edit, self.out_btn,
+            self.image_col, self.newname_col,
+            self.vendor_col, self.vendor_value,
+            self.settings_tab,
+            self.run_btn,
+        ]
     # ---------------- UI END ----------------
 
     # ---------------- ACTIONS ----------------
@@ -348,7 +884,8 @@ class ImageTool(QMainWindow):
         self.excel_edit.setText(path)
 
         try:
-            self.df = pd.read_excel(path)
+            self.df = read_excel(path)
+            self.excel_path = path
 
             self.columns = list(self.df.columns)
 
@@ -385,47 +922,75 @@ class ImageTool(QMainWindow):
         self.vendor_value.clear()
         self.vendor_value.addItem("All Vendors")
 
+        self.vendors_set = set()
+
         if self.df is None or not vendor_col:
             return
 
-        vendors = (
-            self.df[vendor_col]
-            .dropna()
-            .astype(str)
-            .str.strip()
-            .unique()
-        )
+        try:
+            self.ensure_columns([vendor_col])
+        except Exception as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+
+        vendors = list(self.vendor_categories(vendor_col).cat.categories)
+        self.vendors_set = set(vendors)
 
         self.vendor_value.addItems(sorted(vendors))
 
-    def find_image_file(self, stem: str):
+    def ensure_columns(self, needed: list):
+        """
+        The sheet may have been loaded with only the mapped columns. If any
+        of needed is missing, re-read it with those columns added.
+        """
+        needed = [c for c in needed if c]
+
+        if all(c in self.df.columns for c in needed):
+            return
+
+        usecols = list(dict.fromkeys([*self.df.columns, *needed]))
+        self.df = read_excel(self.excel_path, usecols=usecols)
+
+    def vendor_categories(self, vendor_col: str) -> pd.Series:
+        """
+        Stripped, categorical copy of the vendor column, so filtering by vendor
+        is a compare on category codes instead of strings. Cached per column
+        and per loaded sheet; self.df itself is left untouched.
+        """
+        cached = self._vendor_cache
+
+        if cached is None or cached[0] is not self.df or cached[1] != vendor_col:
+            cat = self.df[vendor_col].astype("string").str.strip().astype("category")
+            cached = self._vendor_cache = (self.df, vendor_col, cat)
+
+        return cached[2]
+
+    def find_image_file(self, stem: str, preferred_ext: str):
         """
         Look up stem in prebuilt index.
         Returns (Path, was_fallback)
+        Results are cached per stem until the index is rebuilt, since
+        sheets often reference the same image from many rows.
         """
-        stem = stem.lower()
+        key = (stem.lower(), preferred_ext)
+
+        cached = self._find_cache.get(key, _SENTINEL)
+        if cached is not _SENTINEL:
+            return cached
 
+        result = self._find_uncached(*key)
+        self._find_cache[key] = result
+        return result
+
+    def _find_uncached(self, stem: str, preferred_ext: str):
         if stem not in self.image_index:
             return None, None
 
         candidates = self.image_index[stem]
 
-        # Preferred match first
-        for p in candidates:
-            if p.suffix.lower() == self.preferred_ext:
-                return p, False
-
-        # Fallback
-        fallback_files = sorted(
-            candidates,
-            key=lambda x: x.stat().st_size,
-            reverse=True
-        )
-
-        if fallback_files:
-            return fallback_files[0], True
-
-        return None, None
+        # Preferred match first, otherwise the largest file as fallback
+        i, was_fallback = pick_candidate(candidates, preferred_ext)
+        return Path(candidates[i][0]), was_fallback
         
     def update_fallback_mode(self, text):
         if text.startswith("Do nothing"):
@@ -438,19 +1003,21 @@ class ImageTool(QMainWindow):
     def resolve_output_path(self, out_dir: Path, base_name: str, ext: str) -> Path:
         """
         Returns a non-overwriting output path by appending _1, _2, etc if needed.
+        Probes the in-memory listing of out_dir taken at the start of the run;
+        names handed out are added to it, since the copy that creates them
+        may still be queued on the thread pool.
         """
         base_name = sanitize_filename(base_name)
-        candidate = out_dir / f"{base_name}{ext}"
-
-        if not candidate.exists():
-            return candidate
+        taken = self._out_names
 
+        name = f"{base_name}{ext}"
         i = 1
-        while True:
-            candidate = out_dir / f"{base_name}_{i}{ext}"
-            if not candidate.exists():
-                return candidate
+        while name.casefold() in taken:
+            name = f"{base_name}_{i}{ext}"
             i += 1
+
+        taken.add(name.casefold())
+        return out_dir / name
     
     def save_settings(self):
         self.settings.setValue("remember", self.remember_checkbox.isChecked())
@@ -469,6 +1036,7 @@ class ImageTool(QMainWindow):
 
         self.settings.setValue("preferred_ext", self.preferred_ext)
         self.settings.setValue("fallback_mode", self.fallback_mode)
+        self.settings.setValue("max_side", self.max_side)
 
     def load_settings(self):
         remember = self.settings.value("remember", "true") == "true"
@@ -488,9 +1056,23 @@ class ImageTool(QMainWindow):
         # Load Excel automatically if it exists
         if excel_path and Path(excel_path).exists():
             try:
-                if excel_path and Path(excel_path).exists():
-                    xls = pd.ExcelFile(excel_path)
-                    self.df = pd.read_excel(excel_path, sheet_name=0)
+                # The column mapping is known up front, so only read the
+                # header for the combo boxes plus the mapped columns
+                self.columns = list(read_excel(excel_path, nrows=0).columns)
+                needed = [
+                    c for c in dict.fromkeys(
+                        self.settings.value(key, "")
+                        for key in ("image_col", "newname_col", "vendor_col")
+                    )
+                    if c in self.columns
+                ]
+
+                if needed:
+                    self.df = read_excel(excel_path, usecols=needed)
+                else:
+                    self.df = read_excel(excel_path)
+
+                self.excel_path = excel_path
 
             except Exception as e:
                 logging.error(f"Failed to load saved Excel file: {e}")
@@ -503,8 +1085,6 @@ class ImageTool(QMainWindow):
                 self.df = None
                 return
 
-            self.columns = list(self.df.columns)
-
             for box in (self.image_col, self.newname_col, self.vendor_col):
                 box.clear()
                 box.addItem("")
@@ -517,7 +1097,10 @@ class ImageTool(QMainWindow):
             self.newname_col.setCurrentText(self.settings.value("newname_col", ""))
             self.vendor_col.setCurrentText(self.settings.value("vendor_col", ""))
             self.update_vendor_list()
-            self.vendor_value.setCurrentText(self.settings.value("vendor_value", ""))
+
+            vendor_value = self.settings.value("vendor_value", "")
+            if vendor_value in self.vendors_set:
+                self.vendor_value.setCurrentText(vendor_value)
 
         # Restore preferred extension
         preferred_ext = self.settings.value("preferred_ext", ".jpg")
@@ -535,33 +1118,43 @@ class ImageTool(QMainWindow):
         else:
             self.fallback_box.setCurrentIndex(2)
 
-    def build_image_index(self):
-        base_path = self.base_edit.text().strip()
-
-        if not base_path:
-            QMessageBox.warning(self, "Error", "Base image folder is required.")
-            return False
+        # Restore max converted image size
+        self.max_side = int(self.settings.value("max_side", 0))
+        self.max_side_box.setValue(self.max_side)
 
-        base = Path(base_path)
-
-        if not base.exists():
-            QMessageBox.warning(self, "Error", "Base image folder does not exist.")
-            return False
-
-        self.status_label.setText("Indexing images...")
-        QApplication.processEvents()
-
-        self.image_index = {}
-
-        for file in base.rglob("*"):
-            if file.is_file():
-                stem = file.stem.lower()
-                self.image_index.setdefault(stem, []).append(file)
-
-        self.status_label.setText("Index ready")
-        QApplication.processEvents()
+    def build_image_index(self, base: Path):
+        """
+        Scans base for images. Called from the RunWorker thread, so it only
+        touches the index, never any widgets.
+        """
+        idx = {}
+
+        # Walk with plain strings and DirEntry type info. Each entry is
+        # (full_path, ext_lower, size): sizes are read while scanning so
+        # the fallback pick needs no stat, and extensions are interned so
+        # the preferred-type check is a cheap string compare. Paths are only
+        # built for the file find_image_file returns.
+        # Unreadable folders are skipped, as Path.rglob did, and logged by
+        # the worker.
+        self.index_skipped = []
+        stack = [str(base)]
+        while stack:
+            folder = stack.pop()
+            try:
+                with os.scandir(folder) as it:
+                    for e in it:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append(e.path)
+                        elif e.is_file(follow_symlinks=False):
+                            stem, ext = os.path.splitext(e.name)
+                            idx.setdefault(stem.lower(), []).append(
+                                (e.path, sys.intern(ext.lower()), e.stat(follow_symlinks=False).st_size)
+                            )
+            except OSError as e:
+                self.index_skipped.append((folder, e))
 
-        return True
+        self.image_index = idx
+        self._find_cache = {}
 
     def run(self):
         self.convert_all_mode = False
@@ -582,18 +1175,36 @@ class ImageTool(QMainWindow):
             QMessageBox.warning(self, "Error", "Please select an Output Folder.")
             return
 
-        if not self.build_image_index():
+        base_path = self.base_edit.text().strip()
+
+        if not base_path:
+            QMessageBox.warning(self, "Error", "Base image folder is required.")
             return
 
-        copied_original = 0
-        copied_renamed = 0
-        converted_original = 0
-        converted_renamed = 0
-        not_found_rows = []
+        base = Path(base_path)
+
+        if not base.exists():
+            QMessageBox.warning(self, "Error", "Base image folder does not exist.")
+            return
 
+        vendor_col = self.vendor_col.currentText()
+
+        # Lock the inputs before anything slow, so a queued click can't
+        # start a second run; every early return below unlocks again
+        self.set_running(True)
 
-        out_dir = Path(self.out_edit.text())
-        out_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            self.ensure_columns([img_col, rename_col, vendor_col])
+            out_dir = Path(self.out_edit.text())
+            out_dir.mkdir(parents=True, exist_ok=True)
+
+            # Casefolded, as on the case-insensitive Windows and macOS defaults;
+            # on case-sensitive filesystems this only costs an extra _1 suffix
+            self._out_names = {n.casefold() for n in os.listdir(out_dir)}
+        except Exception as e:
+            self.set_running(False)
+            QMessageBox.critical(self, "Error", str(e))
+            return
 
         log_path = out_dir / "process_log.txt"
 
@@ -607,16 +1218,20 @@ class ImageTool(QMainWindow):
             format="%(asctime)s - %(levelname)s - %(message)s"
         )
 
-        vendor_col = self.vendor_col.currentText()
         selected_vendor = self.vendor_value.currentText()
 
 
         rows = self.df
 
         if vendor_col and selected_vendor != "All Vendors":
-            rows = rows[
-                rows[vendor_col].astype(str).str.strip() == selected_vendor
-            ]
+            cat = self.vendor_categories(vendor_col).cat
+
+            if selected_vendor in cat.categories:
+                # Plain ndarray mask: no intermediate Series or index alignment
+                target_code = cat.categories.get_loc(selected_vendor)
+                rows = rows.iloc[cat.codes.to_numpy() == target_code]
+            else:
+                rows = rows.iloc[0:0]
 
         total = len(rows)
 
@@ -629,153 +1244,180 @@ class ImageTool(QMainWindow):
         self.progress_bar.setMaximum(total)
         self.progress_bar.setValue(0)
         self.progress_text.setText("Starting...")
-        QApplication.processEvents()
 
-        for i, (_, row) in enumerate(rows.iterrows(), start=1):
+        show_preview = self.preview_toggle.currentText() == "Show preview before overwriting"
 
-            raw_path = row[img_col]
+        self.run_thread = QThread(self)
+        self.run_worker = RunWorker(self, rows, base, img_col, rename_col, out_dir, show_preview)
+        self.run_worker.moveToThread(self.run_thread)
 
-            if pd.isna(raw_path):
-                logging.warning("Row has empty image path — marked not found")
-                not_found_rows.append(row)
-                continue
-
-            filename = Path(str(raw_path)).name
-            original_stem = Path(filename).stem.lower()
+        self.run_thread.started.connect(self.run_worker.run)
+        self.run_worker.progress.connect(self.progress_bar.setValue, Qt.QueuedConnection)
+        self.run_worker.status.connect(self.progress_text.setText, Qt.QueuedConnection)
+        self.run_worker.finished.connect(self.on_run_finished, Qt.QueuedConnection)
+        self.run_worker.finished.connect(self.run_thread.quit)
+        self.run_thread.finished.connect(self.run_worker.deleteLater)
+        self.run_thread.finished.connect(self.run_thread.deleteLater)
 
-            # Determine output stem
-            if rename_enabled:
-                new_value = row[rename_col]
-                if pd.notna(new_value) and str(new_value).strip():
-                    output_stem = sanitize_filename(str(new_value).strip())
-                else:
-                    output_stem = original_stem
-            else:
-                output_stem = original_stem
-
-            src_path, was_fallback = self.find_image_file(original_stem)
-
-            if src_path:
-                dest_path = self.resolve_output_path(
-                    out_dir,
-                    output_stem,
-                    self.preferred_ext
-                )
-
-                if not was_fallback:
-                    self.progress_text.setText(f"Copying: {dest_path.name}")
-                    QApplication.processEvents()
-
-                    logging.info(f"COPY preferred: {src_path} -> {dest_path}")
-                    shutil.copy2(src_path, dest_path)
-
-                    if rename_enabled:
-                        copied_renamed += 1
-                    else:
-                        copied_original += 1
+        self.run_thread.start()
 
+    def on_run_finished(self, run_result: dict):
+        """
+        Runs on the GUI thread once the worker has planned every row and the
+        pool has drained. Handles the queued ConversionDialog rows; the
+        summary follows in finish_run().
+        """
+        self.run_thread = None
+        self.run_worker = None
+
+        if run_result["error"]:
+            self.progress_text.setText("Failed")
+            self.status_label.setText("Failed")
+            self.set_running(False)
+            QMessageBox.critical(self, "Error", f"Processing failed:\n\n{run_result['error']}")
+            return
 
-                else:
-                    logging.info(f"Fallback found: {src_path}")
+        self.run_counts = run_result["counts"]
+        self.run_done = run_result["done"]
+        self._last_ui = time.monotonic()
 
-                    if self.fallback_mode in ("convert", "copy"):
+        rename_enabled = run_result["rename_enabled"]
+        max_side = run_result["max_side"]
 
-                        # Only show dialog if preview is enabled AND we are not in convert-all mode
-                        if (
-                            self.fallback_mode == "convert"
-                            and not self.convert_all_mode
-                            and self.preview_toggle.currentText() == "Show preview before overwriting"
-                        ):
+        # ---- Interactive conversions ----
+        # Approved conversions go to the thread pool as CopyJobs, so Pillow
+        # works while the next dialog is up (or the rest of a Convert All).
+        # The summary is written once the last of them reports back.
+        self._run_result = run_result
+        self._conversion_jobs = []
+        self._conversions_pending = 0
+        self._dialogs_done = False
+        self._cancelled = False
 
-                            dialog = ConversionDialog(
-                                src_path,
-                                dest_path,
-                                rename_enabled,
-                                self
-                            )
+        pool = QThreadPool.globalInstance()
 
-                            result = dialog.exec()
+        # Whatever goes wrong in here, the run must still finish so the
+        # inputs unlock; an error is treated like Cancel All
+        error = None
 
-                            # Cancel All
-                            if result == -1:
-                                logging.warning("User cancelled processing")
-                                return
+        try:
+            for src_path, dest_path in run_result["dialog_queue"]:
+
+                # Only show dialog if we are not in convert-all mode
+                if not self.convert_all_mode:
+
+                    dialog = ConversionDialog(
+                        src_path,
+                        dest_path,
+                        rename_enabled,
+                        self
+                    )
+
+                    choice = dialog.exec()
+
+                    # Cancel All
+                    if choice == -1:
+                        logging.warning("User cancelled processing")
+                        self._cancelled = True
+                        break
+
+                    # Skip
+                    elif choice == 0:
+                        logging.info("User skipped this image")
+                        self.run_done += 1
+                        self.update_progress()
+                        continue
+
+                    # Convert All
+                    elif choice == 2:
+                        logging.info("User selected Convert All")
+                        self.convert_all_mode = True
+
+                self.update_progress(f"Converting: {src_path.name} → {dest_path.name}")
+
+                logging.info(f"CONVERT fallback: {src_path} -> {dest_path}")
+                job = CopyJob(src_path, dest_path, "convert", rename_enabled, max_side)
+                job.signals.finished.connect(self.on_conversion_finished)
+                self._conversion_jobs.append(job)
+                self._conversions_pending += 1
+                pool.start(job)
+        except Exception as e:
+            logging.exception("Conversion dialogs failed")
+            self._cancelled = True
+            error = e
 
-                            # Skip
-                            elif result == 0:
-                                logging.info("User skipped this image")
-                                continue
+        self._dialogs_done = True
+        self.maybe_finish_run()
 
-                            # Convert All
-                            elif result == 2:
-                                logging.info("User selected Convert All")
-                                self.convert_all_mode = True
+        if error is not None:
+            QMessageBox.critical(self, "Error", f"Processing stopped:\n\n{error}")
 
-                    if self.fallback_mode == "convert":
-                        self.progress_text.setText(
-                            f"Converting: {src_path.name} → {dest_path.name}"
-                        )
-                        QApplication.processEvents()
-
-                        logging.info(f"CONVERT fallback: {src_path} -> {dest_path}")
-                        convert_image(src_path, dest_path)
+    def on_conversion_finished(self, result: dict):
+        """
+        Runs on the GUI thread for every dialog-approved conversion.
+        """
+        self._conversions_pending -= 1
+        self.run_done += 1
 
-                        if rename_enabled:
-                            converted_renamed += 1
-                        else:
-                            converted_original += 1
+        if result["error"]:
+            logging.error(f"FAILED: {result['src']} -> {result['dest']}: {result['error']}")
+            self.run_counts["failed"] += 1
+        else:
+            count_result(self.run_counts, "convert", result["renamed"])
 
-                    elif self.fallback_mode == "copy":
-                        self.progress_text.setText(f"Copying (fallback): {dest_path.name}")
-                        QApplication.processEvents()
+        self.update_progress(force=not self._conversions_pending)
+        self.maybe_finish_run()
 
-                        logging.info(f"COPY fallback as-is: {src_path} -> {dest_path}")
-                        shutil.copy2(src_path, dest_path)
+    def maybe_finish_run(self):
+        """
+        Finish the run once the dialogs are done and every approved
+        conversion has reported back. Until then the run stays locked.
+        """
+        if self._run_result is None or not self._dialogs_done or self._conversions_pending:
+            return
 
-                        if rename_enabled:
-                            copied_renamed += 1
-                        else:
-                            copied_original += 1
+        run_result = self._run_result
+        self._run_result = None
+        self._conversion_jobs = []
 
-                    else:
-                        self.progress_text.setText(f"Not found: {filename}")
-                        QApplication.processEvents()
+        if self._cancelled:
+            self.progress_text.setText("Cancelled")
+            self.status_label.setText("Cancelled")
+            self.set_running(False)
+            return
 
-                        logging.warning(f"NOT FOUND in index: {filename}")
-                        not_found_rows.append(row)
+        self.finish_run(run_result)
 
-            else:
-                self.progress_text.setText(f"Not found: {filename}")
-                QApplication.processEvents()
+    def finish_run(self, run_result: dict):
+        rows = run_result["rows"]
+        not_found_rows = run_result["not_found_rows"]
 
-                logging.warning(f"NOT FOUND in index: {filename}")
-                not_found_rows.append(row)
-            self.progress_bar.setValue(i)
-            QApplication.processEvents()
+        total = len(rows)
+        copied_original = self.run_counts["copied_original"]
+        copied_renamed = self.run_counts["copied_renamed"]
+        converted_original = self.run_counts["converted_original"]
+        converted_renamed = self.run_counts["converted_renamed"]
+        failed = self.run_counts["failed"]
 
         self.progress_text.setText("Finished")
-        QApplication.processEvents()
         self.status_label.setText("Finished")
         self.progress_bar.setValue(self.progress_bar.maximum())
-
-        if not_found_rows:
-            df_missing = pd.DataFrame(not_found_rows)
-            missing_path = out_dir / "not_found_images.xlsx"
-            df_missing.to_excel(missing_path, index=False)
-        
-            # Summary logging
-            logging.info("===== Run Complete =====")
-            logging.info(f"Total rows processed: {total}")
-            logging.info(f"Copied (original name): {copied_original}")
-            logging.info(f"Copied (renamed): {copied_renamed}")
-            logging.info(f"Converted (original name): {converted_original}")
-            logging.info(f"Converted (renamed): {converted_renamed}")
-            logging.info(f"Not found: {len(not_found_rows)}")
-
-            QMessageBox.information(
-                self,
-                "Completed",
-                f"""
+        self.set_running(False)
+
+        # Summary logging
+        logging.info("===== Run Complete =====")
+        logging.info(f"Total rows processed: {total}")
+        logging.info(f"Copied (original name): {copied_original}")
+        logging.info(f"Copied (renamed): {copied_renamed}")
+        logging.info(f"Converted (original name): {converted_original}")
+        logging.info(f"Converted (renamed): {converted_renamed}")
+        logging.info(f"Failed: {failed}")
+        logging.info(f"Not found: {len(not_found_rows)}")
+
+        QMessageBox.information(
+            self,
+            "Completed",
+            f"""
         Processing complete.
 
         Total rows processed: {total}
@@ -786,13 +1428,47 @@ class ImageTool(QMainWindow):
         Converted (original name): {converted_original}
         Converted (renamed): {converted_renamed}
 
+        Failed: {failed}
         Not found: {len(not_found_rows)}
 
-        {'Missing rows exported to not_found_images.xlsx' if not_found_rows else ''}
+        {'Missing rows exported to not_found_images.xlsx' if run_result["missing_exported"] else ''}
         """.strip()
         )
 
+    def set_running(self, running: bool):
+        self.running = running
+
+        for widget in self.run_locked_widgets:
+            widget.setEnabled(not running)
+
+        if not running:
+            self.vendor_value.setEnabled(bool(self.vendor_col.currentText()))
+
+    def update_progress(self, text: str = None, force: bool = False) -> bool:
+        """
+        Push run_done (and optionally a status line) to the progress widgets,
+        at most every 32 items or 100 ms unless forced. Returns True if the
+        widgets were updated.
+        """
+        now = time.monotonic()
+
+        if not force and self.run_done % 32 and now - self._last_ui < 0.1:
+            return False
+
+        self._last_ui = now
+
+        if text:
+            self.progress_text.setText(text)
+        self.progress_bar.setValue(self.run_done)
+
+        return True
+
     def closeEvent(self, event):
+        if self.running:
+            QMessageBox.warning(self, "Busy", "Please wait for the current run to finish.")
+            event.ignore()
+            return
+
         self.save_settings()
         event.accept()
 
@@ -801,9 +1477,7 @@ class ImageConflictDialog(QMessageBox):
         super().__init__()
         self.setWindowTitle("Image Conflict")
 
-        pixmap = QPixmap(str(src))
-        if not pixmap.isNull():
-            pixmap = pixmap.scaled(300, 300, Qt.KeepAspectRatio)
+        pixmap = preview_pixmap(src, 300, 300)
 
         text = (
             f"File already exists:\n\n"
@@ -833,11 +1507,10 @@ class ConversionDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # ---- IMAGE PREVIEW ----
-        pixmap = QPixmap(str(src))
+        pixmap = preview_pixmap(src, 300, 300)
         image_label = QLabel()
 
         if not pixmap.isNull():
-            pixmap = pixmap.scaled(300, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             image_label.setPixmap(pixmap)
         else:
             image_label.setText("Preview not available")